@@ -5,15 +5,29 @@ Serves static files only - STL generation happens client-side via Three.js
 """
 
 from flask import Flask, send_from_directory, jsonify
+import os
 import sys
 
 app = Flask(__name__, static_folder='.', static_url_path='')
 
+# Hand static file bodies to a fronting server (Apache mod_xsendfile,
+# lighttpd) via X-Sendfile. Only enable when such a proxy is in place.
+app.config['USE_X_SENDFILE'] = os.environ.get('RACK_USE_X_SENDFILE') == '1'
+
+# Seconds browsers may reuse index.html before revalidating. Defaults to 0:
+# rack-mount-generator.js is served unversioned, so a cached page could pair
+# with a newer script. ETag and Last-Modified still turn repeat loads into a
+# 304 with no body.
+try:
+    INDEX_MAX_AGE = max(0, int(os.environ.get('RACK_INDEX_MAX_AGE', '0')))
+except ValueError:
+    INDEX_MAX_AGE = 0
+
 
 @app.route('/')
 def index():
     """Serve the main HTML file"""
-    return send_from_directory('.', 'index.html')
+    return send_from_directory('.', 'index.html', max_age=INDEX_MAX_AGE)
 
 
 @app.route('/api/health', methods=['GET'])
@@ -1,5 +1,24 @@
 // THREE.JS Scene Setup
-let scene, camera, renderer, controls, mountMesh, supportMesh;
+let scene, camera, renderer, controls, mountMesh;
+
+// Inputs the current preview was built from (see updatePreview)
+let lastPreviewKey = null;
+let lastPreviewWide = null;
+
+// Preview materials, shared by every rebuild instead of being recreated
+// on each input event
+const MATERIALS = {
+    bracket: new THREE.MeshPhongMaterial({ color: 0x667eea }),
+    shelf: new THREE.MeshPhongMaterial({ color: 0x764ba2 }),
+    ear: new THREE.MeshPhongMaterial({ color: 0x4CAF50 }),
+    flange: new THREE.MeshPhongMaterial({ color: 0x9C27B0 }), // Purple, also used for flange gussets
+    device: new THREE.MeshPhongMaterial({
+        color: 0xff6b6b,
+        transparent: true,
+        opacity: 0.4,
+        wireframe: false
+    })
+};
 
 function initScene() {
     const container = document.getElementById('preview-container');
@@ -42,12 +61,40 @@ function animate() {
 
 // Check if device requires full-width (two-bracket) mode
 function isWideDeviceMode(width, tolerance) {
-    const RACK_HALF_WIDTH = 225.0;
     const openingWidth = width + 2 * tolerance;
     // If opening is wider than 200mm, use wide mode (two brackets)
     return openingWidth > 200;
 }
 
+// Rack ear hole Y positions: three per rack unit at standard EIA-310 spacing
+function calculateRackHolePositions(rackUnits) {
+    const RACK_UNIT_HEIGHT = 44.45;
+    const holePositions = [];
+    for (let u = 0; u < rackUnits; u++) {
+        const baseY = u * RACK_UNIT_HEIGHT;
+        holePositions.push(baseY + 6.35, baseY + 22.225, baseY + 38.1);
+    }
+    return holePositions;
+}
+
+// Joining-flange hole Y positions (relative to the flange): roughly one
+// per 20mm with 5mm edge margins, a single centred hole on short flanges
+function calculateFlangeHolePositions(flangeHeight) {
+    const holePositions = [];
+    if (flangeHeight >= 20) {
+        const numHoles = Math.max(1, Math.floor(flangeHeight / 20));
+        const edgeMargin = 5;
+        const usableHeight = flangeHeight - 2 * edgeMargin;
+        const spacing = numHoles > 1 ? usableHeight / (numHoles - 1) : 0;
+        for (let i = 0; i < numHoles; i++) {
+            holePositions.push(edgeMargin + (numHoles > 1 ? i * spacing : usableHeight / 2));
+        }
+    } else if (flangeHeight >= 6) {
+        holePositions.push(flangeHeight / 2);
+    }
+    return holePositions;
+}
+
 // Helper function to create a rounded rectangle path (for use as a hole)
 function createRoundedRectPath(x, y, width, height, radius) {
     const path = new THREE.Path();
@@ -88,6 +135,52 @@ function createRoundedRectPath(x, y, width, height, radius) {
     return path;
 }
 
+// Extruded faceplate (front face at Z=0, extending back by its thickness)
+// with an optional hole path cut through it. Used for blank panels
+// (holePath null) and for faceplates with a closed opening.
+function createFaceplateMesh(faceplateWidth, faceplateHeight, faceplateThickness, material, holePath) {
+    const faceplateShape = new THREE.Shape();
+    faceplateShape.moveTo(0, 0);
+    faceplateShape.lineTo(faceplateWidth, 0);
+    faceplateShape.lineTo(faceplateWidth, faceplateHeight);
+    faceplateShape.lineTo(0, faceplateHeight);
+    faceplateShape.lineTo(0, 0);
+    
+    if (holePath) {
+        faceplateShape.holes.push(holePath);
+    }
+    
+    const extrudeSettings = {
+        steps: 1,
+        depth: faceplateThickness,
+        bevelEnabled: false
+    };
+    
+    const faceplateMesh = new THREE.Mesh(new THREE.ExtrudeGeometry(faceplateShape, extrudeSettings), material);
+    faceplateMesh.position.set(0, 0, -faceplateThickness);
+    return faceplateMesh;
+}
+
+// Build a faceplate with a rectangular opening from BoxGeometry sections.
+// Each entry is one section's [x, y, width, height] on the faceplate;
+// sections that collapse to nothing (opening touching an edge) are skipped.
+function addFaceplateSections(group, material, faceplateWidth, faceplateHeight, faceplateThickness, openingStart, openingEnd, openingY, openingHeight) {
+    const openingTop = openingY + openingHeight;
+    const sections = [
+        [0, 0, faceplateWidth, openingY],                                           // Below opening
+        [0, openingTop, faceplateWidth, faceplateHeight - openingTop],              // Above opening
+        [0, openingY, openingStart, openingHeight],                                 // Left of opening
+        [openingEnd, openingY, faceplateWidth - openingEnd, openingHeight]          // Right of opening
+    ];
+    
+    sections.forEach(([x, y, w, h]) => {
+        if (w <= 0 || h <= 0) return;
+        const sectionMesh = new THREE.Mesh(new THREE.BoxGeometry(w, h, faceplateThickness), material);
+        sectionMesh.position.set(x + w/2, y + h/2, -faceplateThickness/2);
+        group.add(sectionMesh);
+    });
+}
+
 // Generate a single bracket for wide-device mode
 // bracketSide: 'left' or 'right' determines which half we're generating
 function generateWideBracket(width, height, depth, tolerance, wallThickness, addSupport, shelfThickness, flangeThickness, gussetSize, shelfGussetWidth, bracketSide, minRackUnits, cornerRadius) {
@@ -118,10 +211,10 @@ function generateWideBracket(width, height, depth, tolerance, wallThickness, add
     const fullOpeningX = (FULL_RACK_WIDTH - openingWidth) / 2;
     
     // Materials
-    const bracketMat = new THREE.MeshPhongMaterial({ color: 0x667eea });
-    const shelfMat = new THREE.MeshPhongMaterial({ color: 0x764ba2 });
-    const earMat = new THREE.MeshPhongMaterial({ color: 0x4CAF50 });
-    const flangeMat = new THREE.MeshPhongMaterial({ color: 0x9C27B0 });
+    const bracketMat = MATERIALS.bracket;
+    const shelfMat = MATERIALS.shelf;
+    const earMat = MATERIALS.ear;
+    const flangeMat = MATERIALS.flange;
     
     // Calculate this bracket's portion of the opening
     let localOpeningStart, localOpeningEnd;
@@ -139,70 +232,15 @@ function generateWideBracket(width, height, depth, tolerance, wallThickness, add
     
     // BLANK PANEL - solid faceplate
     if (isBlank) {
-        const blankGeom = new THREE.BoxGeometry(faceplateWidth, faceplateHeight, faceplateThickness);
-        const blankMesh = new THREE.Mesh(blankGeom, bracketMat);
-        blankMesh.position.set(faceplateWidth/2, faceplateHeight/2, -faceplateThickness/2);
-        group.add(blankMesh);
+        group.add(createFaceplateMesh(faceplateWidth, faceplateHeight, faceplateThickness, bracketMat, null));
     } else if (localOpeningWidth > 0 && cornerRadius > 0) {
         // Create faceplate with rounded corner opening using ExtrudeGeometry
-        const faceplateShape = new THREE.Shape();
-        faceplateShape.moveTo(0, 0);
-        faceplateShape.lineTo(faceplateWidth, 0);
-        faceplateShape.lineTo(faceplateWidth, faceplateHeight);
-        faceplateShape.lineTo(0, faceplateHeight);
-        faceplateShape.lineTo(0, 0);
-        
-        // Create rounded rectangle hole for opening
         const holeShape = createRoundedRectPath(localOpeningStart, openingY, localOpeningWidth, openingHeight, cornerRadius);
-        faceplateShape.holes.push(holeShape);
-        
-        const extrudeSettings = {
-            steps: 1,
-            depth: faceplateThickness,
-            bevelEnabled: false
-        };
-        
-        const faceplateGeom = new THREE.ExtrudeGeometry(faceplateShape, extrudeSettings);
-        const faceplateMesh = new THREE.Mesh(faceplateGeom, bracketMat);
-        faceplateMesh.position.set(0, 0, -faceplateThickness);
-        group.add(faceplateMesh);
+        group.add(createFaceplateMesh(faceplateWidth, faceplateHeight, faceplateThickness, bracketMat, holeShape));
     } else {
-        // Create faceplate with rectangular opening (original method)
-        
-        // Bottom section (below opening)
-        if (openingY > 0) {
-            const bottomGeom = new THREE.BoxGeometry(faceplateWidth, openingY, faceplateThickness);
-            const bottomMesh = new THREE.Mesh(bottomGeom, bracketMat);
-            bottomMesh.position.set(faceplateWidth/2, openingY/2, -faceplateThickness/2);
-            group.add(bottomMesh);
-        }
-        
-        // Top section (above opening)
-        const topHeight = faceplateHeight - openingY - openingHeight;
-        if (topHeight > 0) {
-            const topGeom = new THREE.BoxGeometry(faceplateWidth, topHeight, faceplateThickness);
-            const topMesh = new THREE.Mesh(topGeom, bracketMat);
-            topMesh.position.set(faceplateWidth/2, openingY + openingHeight + topHeight/2, -faceplateThickness/2);
-            group.add(topMesh);
-        }
-        
-        // Left section (beside opening in local coords)
-        if (localOpeningStart > 0) {
-            const leftGeom = new THREE.BoxGeometry(localOpeningStart, openingHeight, faceplateThickness);
-            const leftMesh = new THREE.Mesh(leftGeom, bracketMat);
-            leftMesh.position.set(localOpeningStart/2, openingY + openingHeight/2, -faceplateThickness/2);
-            group.add(leftMesh);
-        }
-        
-        // Right section (beside opening in local coords)
-        const rightStart = localOpeningEnd;
-        const rightWidth = faceplateWidth - rightStart;
-        if (rightWidth > 0) {
-            const rightGeom = new THREE.BoxGeometry(rightWidth, openingHeight, faceplateThickness);
-            const rightMesh = new THREE.Mesh(rightGeom, bracketMat);
-            rightMesh.position.set(rightStart + rightWidth/2, openingY + openingHeight/2, -faceplateThickness/2);
-            group.add(rightMesh);
-        }
+        // Create faceplate with rectangular opening from box sections
+        addFaceplateSections(group, bracketMat, faceplateWidth, faceplateHeight, faceplateThickness,
+            localOpeningStart, localOpeningEnd, openingY, openingHeight);
     }
     
     // Support shelf - only on the side with opening, with OUTER gusset only
@@ -238,7 +276,7 @@ function generateWideBracket(width, height, depth, tolerance, wallThickness, add
             group.add(shelfMesh);
             
             // Only add the OUTER gusset (towards the rack ear, away from center)
-            if (hasOuterGusset) {
+            if (hasOuterGusset && gussetWidth > 0) {
                 const gussetHeight = height;
                 const gussetShape = new THREE.Shape();
                 gussetShape.moveTo(0, 0);
@@ -279,27 +317,15 @@ function generateWideBracket(width, height, depth, tolerance, wallThickness, add
     // Rack ear - on the outer edge
     const earSide = bracketSide;  // Left bracket gets left ear, right bracket gets right ear
     
+    // Ear X extents, resolved once for both the holed and the plain ear
+    const earXStart = earSide === 'left' ? -EAR_WIDTH : faceplateWidth;
+    const earXEnd = earXStart + EAR_WIDTH;
+    
     if (addRackHoles) {
         const holeRadius = 3.175;
+        const holeX = earXStart + EAR_WIDTH / 2;
         
-        let holeX, earXStart, earXEnd;
-        if (earSide === 'left') {
-            holeX = -EAR_WIDTH / 2;
-            earXStart = -EAR_WIDTH;
-            earXEnd = 0;
-        } else {
-            holeX = faceplateWidth + EAR_WIDTH / 2;
-            earXStart = faceplateWidth;
-            earXEnd = faceplateWidth + EAR_WIDTH;
-        }
-        
-        const holePositions = [];
-        for (let u = 0; u < rackUnits; u++) {
-            const baseY = u * RACK_UNIT_HEIGHT;
-            holePositions.push(baseY + 6.35);
-            holePositions.push(baseY + 22.225);
-            holePositions.push(baseY + 38.1);
-        }
+        const holePositions = calculateRackHolePositions(rackUnits);
         
         const earShape = new THREE.Shape();
         earShape.moveTo(earXStart, 0);
@@ -327,11 +353,7 @@ function generateWideBracket(width, height, depth, tolerance, wallThickness, add
     } else {
         const earGeom = new THREE.BoxGeometry(EAR_WIDTH, faceplateHeight, faceplateThickness);
         const earMesh = new THREE.Mesh(earGeom, earMat);
-        if (earSide === 'left') {
-            earMesh.position.set(-EAR_WIDTH/2, faceplateHeight/2, -faceplateThickness/2);
-        } else {
-            earMesh.position.set(faceplateWidth + EAR_WIDTH/2, faceplateHeight/2, -faceplateThickness/2);
-        }
+        earMesh.position.set(earXStart + EAR_WIDTH/2, faceplateHeight/2, -faceplateThickness/2);
         group.add(earMesh);
     }
     
@@ -381,21 +403,7 @@ function generateWideBracket(width, height, depth, tolerance, wallThickness, add
     // Bottom flange (below opening, at bottom of faceplate)
     const bottomFlangeHeight = openingY;
     if (bottomFlangeHeight > 3) {
-        // Calculate hole Y positions
-        let bottomHoleYPositions = [];
-        if (bottomFlangeHeight >= 6) {
-            if (bottomFlangeHeight >= 20) {
-                const numHoles = Math.max(1, Math.floor(bottomFlangeHeight / 20));
-                const edgeMargin = 5;
-                const usableHeight = bottomFlangeHeight - 2 * edgeMargin;
-                const spacing = numHoles > 1 ? usableHeight / (numHoles - 1) : 0;
-                for (let i = 0; i < numHoles; i++) {
-                    bottomHoleYPositions.push(edgeMargin + (numHoles > 1 ? i * spacing : usableHeight / 2));
-                }
-            } else {
-                bottomHoleYPositions.push(bottomFlangeHeight / 2);
-            }
-        }
+        const bottomHoleYPositions = calculateFlangeHolePositions(bottomFlangeHeight);
         
         const bottomFlangeGeom = createFlangeWithHoles(bottomFlangeHeight, bottomHoleYPositions);
         const bottomFlangeMesh = new THREE.Mesh(bottomFlangeGeom, flangeMat);
@@ -417,21 +425,7 @@ function generateWideBracket(width, height, depth, tolerance, wallThickness, add
     // Top flange (above opening, at top of faceplate)
     const topFlangeHeight = faceplateHeight - openingY - openingHeight;
     if (topFlangeHeight > 3) {
-        // Calculate hole Y positions (relative to flange, not faceplate)
-        let topHoleYPositions = [];
-        if (topFlangeHeight >= 6) {
-            if (topFlangeHeight >= 20) {
-                const numHoles = Math.max(1, Math.floor(topFlangeHeight / 20));
-                const edgeMargin = 5;
-                const usableHeight = topFlangeHeight - 2 * edgeMargin;
-                const spacing = numHoles > 1 ? usableHeight / (numHoles - 1) : 0;
-                for (let i = 0; i < numHoles; i++) {
-                    topHoleYPositions.push(edgeMargin + (numHoles > 1 ? i * spacing : usableHeight / 2));
-                }
-            } else {
-                topHoleYPositions.push(topFlangeHeight / 2);
-            }
-        }
+        const topHoleYPositions = calculateFlangeHolePositions(topFlangeHeight);
         
         const topFlangeGeom = createFlangeWithHoles(topFlangeHeight, topHoleYPositions);
         const topFlangeMesh = new THREE.Mesh(topFlangeGeom, flangeMat);
@@ -449,7 +443,7 @@ function generateWideBracket(width, height, depth, tolerance, wallThickness, add
     // Flange gussets - at corners connecting faceplate to flanges
     // Calculate gusset dimensions - may need to shrink to fit available space
     const gussetDepth = gussetSize;
-    const gussetMat = new THREE.MeshPhongMaterial({ color: 0x9C27B0 });
+    const gussetMat = MATERIALS.flange;
     
     // Bottom gusset: top should align with shelf (openingY), bottom at faceplate bottom (0)
     // So max height is openingY
@@ -540,12 +534,14 @@ function generateMountGeometry(width, height, depth, tolerance, wallThickness, a
         // Left bracket - geometry goes from 0 to RACK_HALF_WIDTH internally
         // Position so it spans -RACK_HALF_WIDTH to 0 in world coords
         const leftBracket = generateWideBracket(width, height, depth, tolerance, wallThickness, addSupport, shelfThickness, flangeThickness, gussetSize, shelfGussetWidth, 'left', minRackUnits, cornerRadius);
+        leftBracket.name = 'bracket_left';
         leftBracket.position.set(-RACK_HALF_WIDTH, 0, 0);
         group.add(leftBracket);
         
         // Right bracket - geometry goes from 0 to RACK_HALF_WIDTH internally
         // Position so it spans 0 to RACK_HALF_WIDTH in world coords
         const rightBracket = generateWideBracket(width, height, depth, tolerance, wallThickness, addSupport, shelfThickness, flangeThickness, gussetSize, shelfGussetWidth, 'right', minRackUnits, cornerRadius);
+        rightBracket.name = 'bracket_right';
         rightBracket.position.set(0, 0, 0);
         group.add(rightBracket);
         
@@ -588,75 +584,25 @@ function generateMountGeometry(width, height, depth, tolerance, wallThickness, a
     const openingY = (faceplateHeight - openingHeight) / 2;
     
     // Material for the bracket
-    const bracketMat = new THREE.MeshPhongMaterial({ color: 0x667eea });
-    const shelfMat = new THREE.MeshPhongMaterial({ color: 0x764ba2 });
-    const earMat = new THREE.MeshPhongMaterial({ color: 0x4CAF50 });
+    const bracketMat = MATERIALS.bracket;
+    const shelfMat = MATERIALS.shelf;
+    const earMat = MATERIALS.ear;
     
     // BLANK PANEL - solid faceplate
     if (isBlank) {
-        const blankGeom = new THREE.BoxGeometry(faceplateWidth, faceplateHeight, faceplateThickness);
-        const blankMesh = new THREE.Mesh(blankGeom, bracketMat);
-        blankMesh.position.set(faceplateWidth/2, faceplateHeight/2, -faceplateThickness/2);
-        group.add(blankMesh);
-    } else if (cornerRadius > 0) {
-        // Create faceplate with rounded corner opening using ExtrudeGeometry
-        const faceplateShape = new THREE.Shape();
-        faceplateShape.moveTo(0, 0);
-        faceplateShape.lineTo(faceplateWidth, 0);
-        faceplateShape.lineTo(faceplateWidth, faceplateHeight);
-        faceplateShape.lineTo(0, faceplateHeight);
-        faceplateShape.lineTo(0, 0);
-        
-        // Create rounded rectangle hole for opening
+        group.add(createFaceplateMesh(faceplateWidth, faceplateHeight, faceplateThickness, bracketMat, null));
+    } else if (cornerRadius > 0 || openingY > 0) {
+        // Create faceplate as one extruded frame around the opening.
+        // With cornerRadius 0 the hole is a plain rectangle; a single
+        // frame needs fewer triangles than four boxes and has no internal
+        // faces where the boxes would meet.
         const holeShape = createRoundedRectPath(openingX, openingY, openingWidth, openingHeight, cornerRadius);
-        faceplateShape.holes.push(holeShape);
-        
-        const extrudeSettings = {
-            steps: 1,
-            depth: faceplateThickness,
-            bevelEnabled: false
-        };
-        
-        const faceplateGeom = new THREE.ExtrudeGeometry(faceplateShape, extrudeSettings);
-        const faceplateMesh = new THREE.Mesh(faceplateGeom, bracketMat);
-        faceplateMesh.position.set(0, 0, -faceplateThickness);
-        group.add(faceplateMesh);
+        group.add(createFaceplateMesh(faceplateWidth, faceplateHeight, faceplateThickness, bracketMat, holeShape));
     } else {
-        // Create faceplate with rectangular hole using BoxGeometry pieces
-        
-        // Bottom section (below opening)
-        if (openingY > 0) {
-            const bottomGeom = new THREE.BoxGeometry(faceplateWidth, openingY, faceplateThickness);
-            const bottomMesh = new THREE.Mesh(bottomGeom, bracketMat);
-            bottomMesh.position.set(faceplateWidth/2, openingY/2, -faceplateThickness/2);
-            group.add(bottomMesh);
-        }
-        
-        // Top section (above opening)
-        const topHeight = faceplateHeight - openingY - openingHeight;
-        if (topHeight > 0) {
-            const topGeom = new THREE.BoxGeometry(faceplateWidth, topHeight, faceplateThickness);
-            const topMesh = new THREE.Mesh(topGeom, bracketMat);
-            topMesh.position.set(faceplateWidth/2, openingY + openingHeight + topHeight/2, -faceplateThickness/2);
-            group.add(topMesh);
-        }
-        
-        // Left section (beside opening)
-        if (openingX > 0) {
-            const leftGeom = new THREE.BoxGeometry(openingX, openingHeight, faceplateThickness);
-            const leftMesh = new THREE.Mesh(leftGeom, bracketMat);
-            leftMesh.position.set(openingX/2, openingY + openingHeight/2, -faceplateThickness/2);
-            group.add(leftMesh);
-        }
-        
-        // Right section (beside opening)
-        const rightWidth = faceplateWidth - openingX - openingWidth;
-        if (rightWidth > 0) {
-            const rightGeom = new THREE.BoxGeometry(rightWidth, openingHeight, faceplateThickness);
-            const rightMesh = new THREE.Mesh(rightGeom, bracketMat);
-            rightMesh.position.set(openingX + openingWidth + rightWidth/2, openingY + openingHeight/2, -faceplateThickness/2);
-            group.add(rightMesh);
-        }
+        // Opening reaches the top and bottom edges, so the frame can't be
+        // closed - build the remaining side pieces from BoxGeometry
+        addFaceplateSections(group, bracketMat, faceplateWidth, faceplateHeight, faceplateThickness,
+            openingX, openingX + openingWidth, openingY, openingHeight);
     }
     
     // Support shelf (extends back from bottom of opening)
@@ -682,74 +628,63 @@ function generateMountGeometry(width, height, depth, tolerance, wallThickness, a
         );
         group.add(shelfMesh);
         
-        // Left triangular gusset (right triangle for support)
-        // Gusset height matches device height
-        const gussetHeight = height; // Device height
-        const gussetShape = new THREE.Shape();
-        gussetShape.moveTo(0, 0);  // Front bottom
-        gussetShape.lineTo(shelfDepth, 0);  // Back bottom
-        gussetShape.lineTo(0, gussetHeight);  // Front top (height = device height)
-        gussetShape.lineTo(0, 0);  // Close
-        
-        const extrudeSettings = {
-            steps: 1,
-            depth: gussetWidth,
-            bevelEnabled: false
-        };
-        
-        const gussetGeom = new THREE.ExtrudeGeometry(gussetShape, extrudeSettings);
-        
-        // Left gusset
-        const leftGusset = new THREE.Mesh(gussetGeom, shelfMat);
-        leftGusset.rotation.y = Math.PI / 2;
-        leftGusset.position.set(
-            openingX - gussetWidth,
-            openingY,
-            -faceplateThickness
-        );
-        group.add(leftGusset);
-        
-        // Right gusset
-        const rightGusset = new THREE.Mesh(gussetGeom, shelfMat);
-        rightGusset.rotation.y = Math.PI / 2;
-        rightGusset.position.set(
-            openingX + openingWidth,
-            openingY,
-            -faceplateThickness
-        );
-        group.add(rightGusset);
+        // Side gussets - skipped when sized to zero, since a zero-width
+        // extrusion only adds degenerate triangles to the STL
+        if (gussetWidth > 0) {
+            // Left triangular gusset (right triangle for support)
+            // Gusset height matches device height
+            const gussetHeight = height; // Device height
+            const gussetShape = new THREE.Shape();
+            gussetShape.moveTo(0, 0);  // Front bottom
+            gussetShape.lineTo(shelfDepth, 0);  // Back bottom
+            gussetShape.lineTo(0, gussetHeight);  // Front top (height = device height)
+            gussetShape.lineTo(0, 0);  // Close
+        
+            const extrudeSettings = {
+                steps: 1,
+                depth: gussetWidth,
+                bevelEnabled: false
+            };
+        
+            const gussetGeom = new THREE.ExtrudeGeometry(gussetShape, extrudeSettings);
+        
+            // Left gusset
+            const leftGusset = new THREE.Mesh(gussetGeom, shelfMat);
+            leftGusset.rotation.y = Math.PI / 2;
+            leftGusset.position.set(
+                openingX - gussetWidth,
+                openingY,
+                -faceplateThickness
+            );
+            group.add(leftGusset);
+        
+            // Right gusset
+            const rightGusset = new THREE.Mesh(gussetGeom, shelfMat);
+            rightGusset.rotation.y = Math.PI / 2;
+            rightGusset.position.set(
+                openingX + openingWidth,
+                openingY,
+                -faceplateThickness
+            );
+            group.add(rightGusset);
+        }
     }
     
     // Rack ear (mounting flange) - built with holes if needed
     const addRackHoles = document.getElementById('addRackHoles').checked;
     
+    // Ear X extents, resolved once for both the holed and the plain ear
+    const earXStart = earSide === 'left' ? -EAR_WIDTH : faceplateWidth;
+    const earXEnd = earXStart + EAR_WIDTH;
+    
     if (addRackHoles) {
-        // Build ear with holes using BufferGeometry
-        // We'll create the ear as a series of segments between holes
         const holeRadius = 3.175; // M6 hole radius (6.35mm / 2)
-        const holeSegments = 24;
         
-        // Calculate hole X position (center of ear)
-        let holeX;
-        let earXStart, earXEnd;
-        if (earSide === 'left') {
-            holeX = -EAR_WIDTH / 2;
-            earXStart = -EAR_WIDTH;
-            earXEnd = 0;
-        } else {
-            holeX = faceplateWidth + EAR_WIDTH / 2;
-            earXStart = faceplateWidth;
-            earXEnd = faceplateWidth + EAR_WIDTH;
-        }
+        // Hole X position (center of ear)
+        const holeX = earXStart + EAR_WIDTH / 2;
         
         // Collect all hole Y positions
-        const holePositions = [];
-        for (let u = 0; u < rackUnits; u++) {
-            const baseY = u * RACK_UNIT_HEIGHT;
-            holePositions.push(baseY + 6.35);
-            holePositions.push(baseY + 22.225);
-            holePositions.push(baseY + 38.1);
-        }
+        const holePositions = calculateRackHolePositions(rackUnits);
         
         // Create ear geometry with holes using shape extrusion
         const earShape = new THREE.Shape();
@@ -782,11 +717,7 @@ function generateMountGeometry(width, height, depth, tolerance, wallThickness, a
         // Simple ear without holes
         const earGeom = new THREE.BoxGeometry(EAR_WIDTH, faceplateHeight, faceplateThickness);
         const earMesh = new THREE.Mesh(earGeom, earMat);
-        if (earSide === 'left') {
-            earMesh.position.set(-EAR_WIDTH/2, faceplateHeight/2, -faceplateThickness/2);
-        } else {
-            earMesh.position.set(faceplateWidth + EAR_WIDTH/2, faceplateHeight/2, -faceplateThickness/2);
-        }
+        earMesh.position.set(earXStart + EAR_WIDTH/2, faceplateHeight/2, -faceplateThickness/2);
         group.add(earMesh);
     }
     
@@ -795,7 +726,7 @@ function generateMountGeometry(width, height, depth, tolerance, wallThickness, a
     // Using ExtrudeGeometry with Shape.holes to create actual holes through the flange
     const flangeWidth = flangeThickness;  // mm (thin for short M3 screws)
     const flangeDepth = 50.8;  // 2 inches
-    const flangeMat = new THREE.MeshPhongMaterial({ color: 0x9C27B0 }); // Purple
+    const flangeMat = MATERIALS.flange;
     const m3HoleRadius = 1.6; // M3 clearance hole
     
     // Calculate hole Y positions
@@ -850,50 +781,54 @@ function generateMountGeometry(width, height, depth, tolerance, wallThickness, a
     group.add(flangeMesh);
     
     // Flange gussets (right-angle triangular supports connecting faceplate back to flange)
-    const gussetHeight = gussetSize;  // Height up the faceplate back (Y)
-    const gussetDepth = gussetSize;   // Depth along the flange (Z)
-    const gussetMat = new THREE.MeshPhongMaterial({ color: 0x9C27B0 }); // Same purple as flange
-    
-    // Create gusset shape - direction depends on ear side
-    // When ear is left, flange is right (inner), gusset points left (into faceplate)
-    // When ear is right, flange is left (inner), gusset points right (into faceplate)
-    const gussetShape = new THREE.Shape();
-    gussetShape.moveTo(0, 0);  // Corner (at faceplate back / flange front)
-    gussetShape.lineTo(0, gussetHeight);  // Up the faceplate back
-    if (earSide === 'left') {
-        gussetShape.lineTo(-gussetDepth, 0);  // Along the flange (into rack, pointing left)
-    } else {
-        gussetShape.lineTo(gussetDepth, 0);  // Along the flange (into rack, pointing right)
-    }
-    gussetShape.lineTo(0, 0);
+    // Skipped when sized to zero (see shelf gussets above)
+    if (gussetSize > 0) {
+        const gussetHeight = gussetSize;  // Height up the faceplate back (Y)
+        const gussetDepth = gussetSize;   // Depth along the flange (Z)
+        const gussetMat = MATERIALS.flange; // Same purple as flange
+    
+        // Create gusset shape - direction depends on ear side
+        // When ear is left, flange is right (inner), gusset points left (into faceplate)
+        // When ear is right, flange is left (inner), gusset points right (into faceplate)
+        const gussetShape = new THREE.Shape();
+        gussetShape.moveTo(0, 0);  // Corner (at faceplate back / flange front)
+        gussetShape.lineTo(0, gussetHeight);  // Up the faceplate back
+        if (earSide === 'left') {
+            gussetShape.lineTo(-gussetDepth, 0);  // Along the flange (into rack, pointing left)
+        } else {
+            gussetShape.lineTo(gussetDepth, 0);  // Along the flange (into rack, pointing right)
+        }
+        gussetShape.lineTo(0, 0);
     
-    const gussetExtrudeSettings = {
-        steps: 1,
-        depth: flangeWidth,
-        bevelEnabled: false
-    };
+        const gussetExtrudeSettings = {
+            steps: 1,
+            depth: flangeWidth,
+            bevelEnabled: false
+        };
     
-    const gussetGeom = new THREE.ExtrudeGeometry(gussetShape, gussetExtrudeSettings);
+        const gussetGeom = new THREE.ExtrudeGeometry(gussetShape, gussetExtrudeSettings);
     
-    // Bottom gusset (lifted 10mm from bottom)
-    const bottomGusset = new THREE.Mesh(gussetGeom, gussetMat);
-    bottomGusset.rotation.x = -Math.PI / 2;  // Rotate to Y-Z plane
-    if (earSide === 'left') {
-        bottomGusset.position.set(faceplateWidth - flangeWidth, 10, -faceplateThickness);
-    } else {
-        bottomGusset.position.set(0, 10, -faceplateThickness);
-    }
-    group.add(bottomGusset);
+        // Bottom gusset (lifted 10mm from bottom)
+        const bottomGusset = new THREE.Mesh(gussetGeom, gussetMat);
+        bottomGusset.rotation.x = -Math.PI / 2;  // Rotate to Y-Z plane
+        if (earSide === 'left') {
+            bottomGusset.position.set(faceplateWidth - flangeWidth, 10, -faceplateThickness);
+        } else {
+            bottomGusset.position.set(0, 10, -faceplateThickness);
+        }
+        group.add(bottomGusset);
     
-    // Top gusset - copy of bottom, shifted up
-    const topGusset = new THREE.Mesh(gussetGeom.clone(), gussetMat);
-    topGusset.rotation.x = -Math.PI / 2;  // Same rotation as bottom
-    if (earSide === 'left') {
-        topGusset.position.set(faceplateWidth - flangeWidth, faceplateHeight - gussetHeight, -faceplateThickness);
-    } else {
-        topGusset.position.set(0, faceplateHeight - gussetHeight, -faceplateThickness);
+        // Top gusset - same shape as bottom, shifted up (shares its geometry,
+        // like the left/right shelf gussets)
+        const topGusset = new THREE.Mesh(gussetGeom, gussetMat);
+        topGusset.rotation.x = -Math.PI / 2;  // Same rotation as bottom
+        if (earSide === 'left') {
+            topGusset.position.set(faceplateWidth - flangeWidth, faceplateHeight - gussetHeight, -faceplateThickness);
+        } else {
+            topGusset.position.set(0, faceplateHeight - gussetHeight, -faceplateThickness);
+        }
+        group.add(topGusset);
     }
-    group.add(topGusset);
     
     // Center the group
     group.position.set(-faceplateWidth/2, -faceplateHeight/2, 0);
@@ -901,6 +836,14 @@ function generateMountGeometry(width, height, depth, tolerance, wallThickness, a
     return group;
 }
 
+// Free the geometry of every mesh under a discarded preview object.
+// Materials are shared (see MATERIALS) and must stay alive.
+function disposeGeometries(object) {
+    object.traverse((child) => {
+        if (child.isMesh) child.geometry.dispose();
+    });
+}
+
 // Update preview
 function updatePreview() {
     const width = parseFloat(document.getElementById('deviceWidth').value);
@@ -915,18 +858,42 @@ function updatePreview() {
     const minRackUnits = parseInt(document.getElementById('minRackUnits').value) || 0;
     const cornerRadius = parseFloat(document.getElementById('cornerRadius').value) || 0;
     const addSupport = document.getElementById('addSupport').checked;
+    const geometryArgs = [width, height, depth, tolerance, wallThickness, addSupport, shelfThickness, flangeThickness, gussetSize, shelfGussetWidth, minRackUnits, cornerRadius];
 
-    // Remove old mesh
-    if (mountMesh) scene.remove(mountMesh);
-    if (supportMesh) scene.remove(supportMesh);
+    // Skip the rebuild if no geometry input changed (e.g. only infill was
+    // edited, or an input event left the value as it was). The key covers the
+    // builder arguments plus the toggles the builders read from the DOM
+    // themselves - add any new DOM read inside a builder here too.
+    const builderToggles = [
+        document.getElementById('earSide').value,
+        document.getElementById('isBlank').checked,
+        document.getElementById('addRackHoles').checked
+    ];
+    const previewKey = geometryArgs.concat(builderToggles).join('|');
+    if (previewKey === lastPreviewKey) {
+        calculateStats(width, height, depth, tolerance, wallThickness, shelfThickness, minRackUnits);
+        return;
+    }
+
+    // Remove old mesh and free its geometry buffers
+    if (mountMesh) {
+        scene.remove(mountMesh);
+        disposeGeometries(mountMesh);
+        mountMesh = null;
+    }
 
     // Generate geometry (returns a group)
-    mountMesh = generateMountGeometry(width, height, depth, tolerance, wallThickness, addSupport, shelfThickness, flangeThickness, gussetSize, shelfGussetWidth, minRackUnits, cornerRadius);
+    mountMesh = generateMountGeometry(...geometryArgs);
     scene.add(mountMesh);
+    // Only record the key once the build succeeded, so a failed build retries
+    lastPreviewKey = previewKey;
 
     // Remove old device mesh if exists
     const oldDevice = scene.getObjectByName('deviceMesh');
-    if (oldDevice) scene.remove(oldDevice);
+    if (oldDevice) {
+        scene.remove(oldDevice);
+        disposeGeometries(oldDevice);
+    }
 
     // Constants
     const RACK_HALF_WIDTH = 225.0;
@@ -934,6 +901,12 @@ function updatePreview() {
     const RACK_UNIT_HEIGHT = 44.45;
     // Use different DEVICE_HEIGHT_PER_U for wide vs standard mode
     const isWide = isWideDeviceMode(width, tolerance);
+    // The file list's download buttons belong to one mode; hide them when
+    // the mode changes so a stale per-bracket button can't be clicked
+    if (lastPreviewWide !== null && isWide !== lastPreviewWide) {
+        document.getElementById('filesContainer').style.display = 'none';
+    }
+    lastPreviewWide = isWide;
     const DEVICE_HEIGHT_PER_U = isWide ? 30.0 : 35.0;
     const calculatedRackUnits = Math.ceil(height / DEVICE_HEIGHT_PER_U);
     const rackUnits = Math.max(calculatedRackUnits, minRackUnits);
@@ -944,13 +917,7 @@ function updatePreview() {
     
     // Add device representation (semi-transparent)
     const deviceGeometry = new THREE.BoxGeometry(width, height, depth);
-    const deviceMaterial = new THREE.MeshPhongMaterial({
-        color: 0xff6b6b,
-        transparent: true,
-        opacity: 0.4,
-        wireframe: false
-    });
-    const deviceMesh = new THREE.Mesh(deviceGeometry, deviceMaterial);
+    const deviceMesh = new THREE.Mesh(deviceGeometry, MATERIALS.device);
     deviceMesh.name = 'deviceMesh';
     
     // Position device based on mode
@@ -1077,24 +1044,21 @@ function exportSTL() {
 
 // Export a specific bracket (for wide mode)
 function exportBracketSTL(bracketSide) {
-    const width = parseFloat(document.getElementById('deviceWidth').value);
-    const height = parseFloat(document.getElementById('deviceHeight').value);
-    const depth = parseFloat(document.getElementById('deviceDepth').value);
-    const tolerance = parseFloat(document.getElementById('tolerance').value);
-    const wallThickness = parseFloat(document.getElementById('wallThickness').value);
-    const shelfThickness = parseFloat(document.getElementById('shelfThickness').value);
-    const flangeThickness = parseFloat(document.getElementById('flangeThickness').value);
-    const gussetSize = parseFloat(document.getElementById('gussetSize').value);
-    const shelfGussetWidth = parseFloat(document.getElementById('shelfGussetWidth').value);
-    const minRackUnits = parseInt(document.getElementById('minRackUnits').value) || 0;
-    const cornerRadius = parseFloat(document.getElementById('cornerRadius').value) || 0;
-    const addSupport = document.getElementById('addSupport').checked;
-    
-    // Generate fresh bracket geometry - it's already in correct local coords (0 to RACK_HALF_WIDTH)
-    const bracket = generateWideBracket(width, height, depth, tolerance, wallThickness, addSupport, shelfThickness, flangeThickness, gussetSize, shelfGussetWidth, bracketSide, minRackUnits, cornerRadius);
+    // Reuse the bracket already built for the preview instead of generating it again
+    if (!mountMesh) {
+        alert('No geometry to export. Please configure your mount first.');
+        return null;
+    }
+    const bracket = mountMesh.getObjectByName('bracket_' + bracketSide);
+    if (!bracket) {
+        alert('The current configuration is not in wide mode. Use Generate Mount to export the single bracket.');
+        return null;
+    }
     
-    // Update all matrices in the hierarchy
-    bracket.updateMatrixWorld(true);
+    // Bake transforms relative to the bracket itself, so the export stays in
+    // local coords (0 to RACK_HALF_WIDTH) regardless of the preview placement
+    mountMesh.updateMatrixWorld(true);
+    const toBracketLocal = new THREE.Matrix4().copy(bracket.matrixWorld).invert();
     
     const exporter = new THREE.STLExporter();
     const exportGroup = new THREE.Group();
@@ -1104,8 +1068,7 @@ function exportBracketSTL(bracketSide) {
         if (child.isMesh) {
             // Clone geometry to avoid modifying original
             const clonedGeom = child.geometry.clone();
-            // Bake the child's world matrix into geometry vertices
-            clonedGeom.applyMatrix4(child.matrixWorld);
+            clonedGeom.applyMatrix4(new THREE.Matrix4().multiplyMatrices(toBracketLocal, child.matrixWorld));
             
             const clonedMesh = new THREE.Mesh(clonedGeom, child.material);
             exportGroup.add(clonedMesh);
@@ -1116,6 +1079,10 @@ function exportBracketSTL(bracketSide) {
 }
 
 function downloadSTLFromPreview() {
+    // Input handling defers rebuilds to the next frame, so bring the preview
+    // up to date before exporting it (a no-op when the inputs are unchanged)
+    updatePreview();
+    
     const width = parseFloat(document.getElementById('deviceWidth').value);
     const tolerance = parseFloat(document.getElementById('tolerance').value);
     
@@ -1142,6 +1109,8 @@ function downloadSTLFromPreview() {
 }
 
 function downloadBracket(side) {
+    // Also reached from the file list buttons, so flush like downloadSTLFromPreview
+    updatePreview();
     const stlData = exportBracketSTL(side);
     if (!stlData) return;
     
@@ -1218,66 +1187,6 @@ document.getElementById('mountForm').addEventListener('submit', async (e) => {
     }
 });
 
-function displayGeneratedFiles(jobId, files, stats) {
-    const fileList = document.getElementById('fileList');
-    fileList.innerHTML = '';
-
-    files.forEach(file => {
-        const item = document.createElement('div');
-        item.className = 'file-item';
-        
-        let sizeInfo = '';
-        if (file.size_mb) {
-            sizeInfo += `${file.size_mb} MB`;
-        }
-        if (file.triangles) {
-            sizeInfo += ` • ${file.triangles.toLocaleString()} triangles`;
-        }
-        
-        item.innerHTML = `
-            <div>
-                <div class="file-name">📄 ${file.name}</div>
-                <div class="file-size">${sizeInfo}</div>
-            </div>
-            <button class="btn-download" onclick="downloadFile('${jobId}', '${file.name}')">⬇ Download</button>
-        `;
-        fileList.appendChild(item);
-    });
-    
-    // Add download all button
-    const downloadAllItem = document.createElement('div');
-    downloadAllItem.className = 'file-item';
-    downloadAllItem.style.marginTop = '15px';
-    downloadAllItem.innerHTML = `
-        <div>
-            <div class="file-name">📦 Download All as ZIP</div>
-            <div class="file-size">All files packaged together</div>
-        </div>
-        <button class="btn-download" style="background: #2196F3;" onclick="downloadAllFiles('${jobId}')">⬇ Download ZIP</button>
-    `;
-    fileList.appendChild(downloadAllItem);
-
-    document.getElementById('filesContainer').style.display = 'block';
-}
-
-function downloadFile(jobId, filename) {
-    const link = document.createElement('a');
-    link.href = `/api/download/${jobId}/${filename}`;
-    link.download = filename;
-    document.body.appendChild(link);
-    link.click();
-    document.body.removeChild(link);
-}
-
-function downloadAllFiles(jobId) {
-    const link = document.createElement('a');
-    link.href = `/api/download-zip/${jobId}`;
-    link.download = `rack_mount_${jobId}.zip`;
-    document.body.appendChild(link);
-    link.click();
-    document.body.removeChild(link);
-}
-
 function resetForm() {
     document.getElementById('mountForm').reset();
     document.getElementById('deviceWidth').value = '100';
@@ -1291,16 +1200,28 @@ function resetForm() {
     updatePreview();
 }
 
+// Coalesce bursts of input events (holding a spinner arrow, fast typing)
+// into at most one preview rebuild per animation frame
+let previewUpdatePending = false;
+function schedulePreviewUpdate() {
+    if (previewUpdatePending) return;
+    previewUpdatePending = true;
+    requestAnimationFrame(() => {
+        previewUpdatePending = false;
+        updatePreview();
+    });
+}
+
 // Input listeners for live preview
 ['deviceWidth', 'deviceHeight', 'deviceDepth', 'tolerance', 'wallThickness', 'cornerRadius', 'shelfThickness', 'flangeThickness', 'gussetSize', 'shelfGussetWidth', 'infill'].forEach(id => {
-    document.getElementById(id).addEventListener('input', updatePreview);
+    document.getElementById(id).addEventListener('input', schedulePreviewUpdate);
 });
 
-document.getElementById('minRackUnits').addEventListener('change', updatePreview);
-document.getElementById('addSupport').addEventListener('change', updatePreview);
-document.getElementById('earSide').addEventListener('change', updatePreview);
-document.getElementById('addRackHoles').addEventListener('change', updatePreview);
-document.getElementById('isBlank').addEventListener('change', updatePreview);
+document.getElementById('minRackUnits').addEventListener('change', schedulePreviewUpdate);
+document.getElementById('addSupport').addEventListener('change', schedulePreviewUpdate);
+document.getElementById('earSide').addEventListener('change', schedulePreviewUpdate);
+document.getElementById('addRackHoles').addEventListener('change', schedulePreviewUpdate);
+document.getElementById('isBlank').addEventListener('change', schedulePreviewUpdate);
 
 // Initialize
 window.addEventListener('load', () => {